@@ -5,7 +5,7 @@ Parses a folder of CBS1 PDF contracts and writes each offer as a new
 column in your Excel comparison spreadsheet.
 
 SETUP (one time):
-    pip install pdfplumber openpyxl Pillow
+    pip install pdfplumber openpyxl Pillow numpy
 
 USAGE:
     python import_offers.py
@@ -17,6 +17,10 @@ You will be prompted for:
 Saves a new file (template name + "_filled.xlsx") and leaves your
 original template untouched.
 
+Parsed offers are cached in ~/.cbs_importer_cache (keyed by the PDF's
+contents), so re-running after adding offers only parses the new PDFs.
+Delete that folder to force a full re-parse.
+
 WHAT GETS FILLED:
   - Buyer name, agent name
   - Purchase price, earnest money, loan amount, loan type
@@ -33,8 +37,13 @@ WHAT IS LEFT BLANK (fill manually):
 """
 
 import re
+import os
 import copy
+import hashlib
+import pickle
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
@@ -47,6 +56,11 @@ try:
 except ImportError:
     sys.exit("Missing Pillow.  Run:  pip install Pillow")
 
+try:
+    import numpy as np
+except ImportError:
+    sys.exit("Missing numpy.  Run:  pip install numpy")
+
 try:
     from openpyxl import load_workbook
     from openpyxl.utils import get_column_letter
@@ -94,6 +108,21 @@ DEADLINE_ITEM_TO_ROW = {
    37: 77,  38: 78,  39: 79,  40: 80,  41: 81,  42: 82,  43: 83,
 }
 
+# Resolution for checkbox rendering. The brightness threshold below was
+# calibrated on real CTM eContracts PDFs at 150 DPI; re-measure checked and
+# unchecked boxes on a real contract before lowering it.
+RENDER_DPI = 150
+
+# A checkbox whose average brightness (0=black, 255=white) is above this is
+# treated as unchecked
+CHECKED_MAX_BRIGHTNESS = 150
+
+# Parsed-contract cache; bump CACHE_VERSION whenever parse_contract's output
+# changes. RENDER_DPI and CHECKED_MAX_BRIGHTNESS are part of the cache key,
+# so changing either one re-parses every PDF automatically.
+CACHE_DIR     = Path.home() / ".cbs_importer_cache"
+CACHE_VERSION = 1
+
 # Rows the script never overwrites (formulas / always-manual fields)
 SKIP_ROWS = {
     8, 9, 10,        # escalation / appraisal gap
@@ -103,30 +132,113 @@ SKIP_ROWS = {
     87, 89,          # post-closing occupancy, other notes
 }
 
+# Section numbers whose first occurrence anchors a windowed text search
+SECTION_MARKERS = ("2.5.3.", "2.6.", "4.1.", "30.")
+
+# ── Text patterns (compiled once, reused for every PDF) ──────────────────────
+BUYER_RE         = re.compile(r"2\.1\.\s+Buyer\.\s+(.+?)\s*\(Buyer\)")
+PRICE_RE         = re.compile(r"§\s*4\.1\.\s+Purchase Price[^\d]+([\d,]+\.\d{2})")
+EARNEST_RE       = re.compile(r"§\s*4\.3\.\s+Earnest Money[^\d]+([\d,]+\.\d{2})")
+LOAN_RE          = re.compile(r"§\s*4\.5\.\s+New Loan[^\d]+([\d,]+\.\d{2})")
+CASH_OMITTED_RE  = re.compile(r"4\.5\. New Loan\. \(Omitted")
+FHA_RE           = re.compile(r"FHA [Ii]nsured")
+VA_RE            = re.compile(r"VA [Gg]uaranteed")
+CONCESSION_RE    = re.compile(r"credit to Buyer .([^\(]+)\(Seller Concession\)")
+COMMISSION_RE    = re.compile(r"29\.1\.\s+([\d\.]+)%\s+of the Purchase Price")
+INCLUSIONS_RE    = re.compile(r"included in the Purchase Price:\s*\n(.+?)(?:\n\n|If the box|2\.5\.4)",
+                              re.DOTALL)
+EXCLUSIONS_RE    = re.compile(r"Exclusions\):\s*\n?(.+?)(?:\n\n|2\.7\.)", re.DOTALL)
+ADD_PROV_RE      = re.compile(r"Colorado Real Estate Commission:\s*\n(.+?)(?=\n31\.)", re.DOTALL)
+DEADLINE_ROW_RE  = re.compile(r"^[^\S\n]*(\d+)[^\S\n]+(?:§[^\S\n]*[\w\.]+|n/a)[^\S\n]+(\S.*)$",
+                              re.MULTILINE)
+DEADLINE_KW_RE   = re.compile(r"\b(?:Deadline|Date|Time)\b")
+PAREN_LEAD_RE    = re.compile(r"^\([^)]+\)\s*")
+WEEKDAY_TAIL_RE  = re.compile(r"\s+(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)$",
+                              re.IGNORECASE)
+
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def pdf_text(pdf_path):
-    with pdfplumber.open(pdf_path) as pdf:
-        return "\n".join(p.extract_text() or "" for p in pdf.pages)
+def index_pages(pdf):
+    """
+    Extract everything the parsers need from each page exactly once.
+    pdfplumber recomputes extract_text() on every call, and the fee parsers
+    visit every page for every section they look up.
+    """
+    pages = []
+    for page in pdf.pages:
+        chars      = page.chars
+        checkboxes = get_page_checkboxes(page)
+        pages.append({
+            'page':       page,
+            'text':       page.extract_text() or "",
+            'chars':      chars,
+            'checkboxes': checkboxes,
+            'cb_ys':      set(round(cb['y0']) for cb in checkboxes),
+            'anchors':    section_anchors(chars),
+            'lines':      text_lines(chars),
+            'char_bands': char_bands(chars),
+        })
+    return pages
+
+
+def pdf_text(pages):
+    return "\n".join(info['text'] for info in pages)
 
 
-def checkbox_brightness(pdf_page, cb_img, pil_img, scale_x, scale_y):
+def section_offsets(text):
+    """
+    Find each SECTION_MARKERS entry in the text once per PDF
+    ({marker: index of first occurrence, or -1}).
+    """
+    return {marker: text.find(marker) for marker in SECTION_MARKERS}
+
+
+def render_page(page, render_cache):
+    """
+    Rasterize a page for checkbox detection, at most once per PDF.
+    Returns (gray, scale_x, scale_y) where gray is the page as a contiguous
+    uint8 NumPy array; cached by page number. Only the array is kept, the
+    PIL image is dropped as soon as it has been converted.
+    """
+    key = page.page_number
+    if key not in render_cache:
+        pil = page.to_image(resolution=RENDER_DPI).original
+        gray = np.ascontiguousarray(pil.convert('L'), dtype=np.uint8)
+        render_cache[key] = (gray, pil.width / page.width, pil.height / page.height)
+    return render_cache[key]
+
+
+def checkbox_brightness(pdf_page, cb_img, gray, scale_x, scale_y):
     """Return average pixel brightness (0=black, 255=white) of a checkbox image."""
     ix = int(cb_img['x0'] * scale_x)
     iy = int((pdf_page.height - cb_img['y1']) * scale_y)
     iw = max(1, int((cb_img['x1'] - cb_img['x0']) * scale_x))
     ih = max(1, int((cb_img['y1'] - cb_img['y0']) * scale_y))
-    crop = pil_img.crop((ix, iy, ix + iw, iy + ih))
-    gray = crop.convert('L')
-    pixels = list(gray.getdata())
-    return sum(pixels) / len(pixels) if pixels else 255
+    # Clamp the start so a box crossing the top/left page edge isn't read
+    # as a negative (wrap-around) index
+    region = gray[max(0, iy):iy + ih, max(0, ix):ix + iw]
+    return float(region.mean()) if region.size else 255
+
+
+def char_bands(chars):
+    """
+    Bucket chars into 4pt bands by vertical midpoint, once per page.
+    Each char is also filed under the bands above and below, so a single
+    band holds every char within 4pt of any y inside it.
+    """
+    bands = defaultdict(list)
+    for c in chars:
+        band = int((c['y0'] + c['y1']) / 2 // 4)
+        for b in (band - 1, band, band + 1):
+            bands[b].append(c)
+    return bands
 
 
-def label_after_checkbox(cb_img, chars, next_cb_x=9999):
+def label_after_checkbox(cb_img, bands, next_cb_x=9999):
     """Return the text immediately to the right of a checkbox."""
     cb_y_mid = (cb_img['y0'] + cb_img['y1']) / 2
-    lc = [c for c in chars
+    lc = [c for c in bands.get(int(cb_y_mid // 4), ())
           if c['x0'] >= cb_img['x1'] - 1 and c['x0'] < next_cb_x
           and abs((c['y0'] + c['y1']) / 2 - cb_y_mid) < 4]
     lc.sort(key=lambda c: c['x0'])
@@ -156,42 +268,60 @@ def get_page_checkboxes(page):
             and abs(img['y1'] - img['y0'] - 10.5) < 1.5]
 
 
-def find_section_anchor_y(section_id, chars):
+def section_anchors(chars):
     """
-    Find the y-coordinate of the section header for section_id.
-    - First char must be a digit (avoids mid-word matches)
-    - Must be at left margin (x < 150)
-    - Must not be preceded by § (avoids cross-references)
+    Index the possible section header starts on a page, once per page.
+    Every digit at the left margin (x < 150) becomes (y0, fragment, prev):
+    the next 10 chars without spaces/dots, and the 4 chars before it.
     """
-    target = section_id.replace('.', '').replace(' ', '')
+    anchors = []
     for i, c in enumerate(chars):
         if c['text'] not in '0123456789':
             continue
         if c['x0'] > 150:
             continue
         fragment = ''.join(ch['text'] for ch in chars[i:i+10]).replace(' ', '').replace('.', '')
-        if not fragment.startswith(target[:min(4, len(target))]):
-            continue
         prev = ''.join(ch['text'] for ch in chars[max(0, i-4):i])
-        if '§' in prev:
-            continue
-        return c['y0']
+        anchors.append((c['y0'], fragment, prev))
+    return anchors
+
+
+def text_lines(chars):
+    """
+    Group chars into lines by rounded y0, once per page.
+    Returns [(y, line_text)] from the top of the page down.
+    """
+    y_lines = {}
+    for c in chars:
+        y = round(c['y0'])
+        y_lines.setdefault(y, []).append(c)
+    return [(y, ''.join(c['text'] for c in sorted(y_lines[y], key=lambda c: c['x0'])))
+            for y in sorted(y_lines, reverse=True)]
+
+
+def find_section_anchor_y(section_id, anchors):
+    """
+    Find the y-coordinate of the section header for section_id.
+    - First char must be a digit (avoids mid-word matches)
+    - Must be at left margin (x < 150)
+    - Must not be preceded by § (avoids cross-references)
+    """
+    target = section_id.replace('.', '').replace(' ', '')
+    prefix = target[:min(4, len(target))]
+    for y0, fragment, prev in anchors:
+        if fragment.startswith(prefix) and '§' not in prev:
+            return y0
     return None
 
 
-def detect_checked_box_at_y(page, options_y, all_checkboxes, render_cache={}):
+def detect_checked_box_at_y(info, options_y, render_cache):
     """
     Given the y-coordinate of an options line (containing Buyer/Seller checkboxes),
     find the checked checkbox and return its dropdown value.
     Handles 2-line fee rows by also checking one line above options_y.
     """
-    pid = id(page)
-    if pid not in render_cache:
-        img_render = page.to_image(resolution=150)
-        pil = img_render.original
-        render_cache[pid] = (pil, pil.width / page.width, pil.height / page.height)
-    pil_img, scale_x, scale_y = render_cache[pid]
-    chars = page.chars
+    page           = info['page']
+    all_checkboxes = info['checkboxes']
 
     # Collect checkboxes at options_y and one line above (for 2-line fee rows)
     option_cbs = [cb for cb in all_checkboxes if abs(cb['y0'] - options_y) < 8]
@@ -202,19 +332,20 @@ def detect_checked_box_at_y(page, options_y, all_checkboxes, render_cache={}):
     if not option_cbs:
         return "n/a"
 
+    gray, scale_x, scale_y = render_page(page, render_cache)
     best_cb = min(option_cbs,
-                  key=lambda cb: checkbox_brightness(page, cb, pil_img, scale_x, scale_y))
-    if checkbox_brightness(page, best_cb, pil_img, scale_x, scale_y) > 150:
+                  key=lambda cb: checkbox_brightness(page, cb, gray, scale_x, scale_y))
+    if checkbox_brightness(page, best_cb, gray, scale_x, scale_y) > CHECKED_MAX_BRIGHTNESS:
         return "n/a"
 
     same_y = [cb for cb in option_cbs if abs(cb['y0'] - best_cb['y0']) < 3]
     next_x = min((cb['x0'] for cb in same_y if cb['x0'] > best_cb['x1']), default=9999)
-    raw_label = label_after_checkbox(best_cb, chars, next_x)
+    raw_label = label_after_checkbox(best_cb, info['char_bands'], next_x)
     value = label_to_dropdown(raw_label)
     return value if value else "n/a"
 
 
-def get_fee_value(pdf_obj, section_id, render_cache={}):
+def get_fee_value(pages, section_id, render_cache):
     """
     Detect the dropdown value for a fee section.
     Strategy:
@@ -223,52 +354,25 @@ def get_fee_value(pdf_obj, section_id, render_cache={}):
        both "Buyer" and "Seller" text — that's the options line
     3. Check pixel brightness to identify the checked checkbox
     """
-    for page in pdf_obj.pages:
-        pt = page.extract_text() or ''
-        if section_id not in pt:
+    for info in pages:
+        if section_id not in info['text']:
             continue
 
-        chars = page.chars
-        checkboxes = get_page_checkboxes(page)
-        if not checkboxes:
+        if not info['checkboxes']:
             continue
 
-        # Find section header anchor:
-        # - first char must be a digit (rules out mid-word matches like "final.")
-        # - must be at left margin (x < 150), not mid-line cross-reference
-        # - must not be preceded by § (eliminates "§ 16.2." cross-refs)
-        target = section_id.replace('.', '').replace(' ', '')
-        anchor_y = None
-        for i, c in enumerate(chars):
-            if c['text'] not in '0123456789':
-                continue
-            if c['x0'] > 150:
-                continue
-            frag = ''.join(ch['text'] for ch in chars[i:i+10]).replace(' ','').replace('.','')
-            if not frag.startswith(target[:min(4, len(target))]):
-                continue
-            prev = ''.join(ch['text'] for ch in chars[max(0, i-4):i])
-            if '§' in prev:
-                continue
-            anchor_y = c['y0']
-            break
-
+        # Find section header anchor (skips "§ 16.2."-style cross-refs)
+        anchor_y = find_section_anchor_y(section_id, info['anchors'])
         if anchor_y is None:
             continue
 
-        # Group chars by y-line for scanning
-        y_lines = {}
-        for c in chars:
-            y = round(c['y0'])
-            y_lines.setdefault(y, []).append(c)
-
-        cb_y_set = set(round(cb['y0']) for cb in checkboxes)
-
         # Scan downward from anchor_y for the options line
         # (lower y = further down the page in PDF coordinates)
+        cb_y_set  = info['cb_ys']
         options_y = None
-        for y in sorted([y for y in y_lines if y <= anchor_y - 5], reverse=True):
-            lt = ''.join(c['text'] for c in sorted(y_lines[y], key=lambda c: c['x0']))
+        for y, lt in info['lines']:
+            if y > anchor_y - 5:
+                continue
             if any(abs(cby - y) < 6 for cby in cb_y_set) and 'Buyer' in lt and 'Seller' in lt:
                 options_y = y
                 break
@@ -276,46 +380,45 @@ def get_fee_value(pdf_obj, section_id, render_cache={}):
         if options_y is None:
             continue
 
-        return detect_checked_box_at_y(page, options_y, checkboxes, render_cache)
+        return detect_checked_box_at_y(info, options_y, render_cache)
 
     return "n/a"
 
 
 # ── PDF parsing ───────────────────────────────────────────────────────────────
 
-def parse_agent(pdf_path):
+def parse_agent(first_page_text):
     """Agent name is always the 2nd non-empty line on page 1."""
-    with pdfplumber.open(pdf_path) as pdf:
-        lines = [l.strip() for l in (pdf.pages[0].extract_text() or "").split("\n") if l.strip()]
+    lines = [l.strip() for l in first_page_text.split("\n") if l.strip()]
     return lines[1] if len(lines) > 1 else ""
 
 
 def parse_buyer(text):
-    m = re.search(r"2\.1\.\s+Buyer\.\s+(.+?)\s*\(Buyer\)", text)
+    m = BUYER_RE.search(text)
     return m.group(1).strip() if m else ""
 
 
-def parse_price(text):
-    idx = text.find("4.1.")
+def parse_price(text, offsets):
+    idx = offsets["4.1."]
     if idx == -1:
         return None
-    m = re.search(r"§\s*4\.1\.\s+Purchase Price[^\d]+([\d,]+\.\d{2})", text[idx:idx+600])
+    m = PRICE_RE.search(text, idx, idx + 600)
     return float(m.group(1).replace(",", "")) if m else None
 
 
-def parse_earnest(text):
-    idx = text.find("4.1.")
+def parse_earnest(text, offsets):
+    idx = offsets["4.1."]
     if idx == -1:
         return None
-    m = re.search(r"§\s*4\.3\.\s+Earnest Money[^\d]+([\d,]+\.\d{2})", text[idx:idx+600])
+    m = EARNEST_RE.search(text, idx, idx + 600)
     return float(m.group(1).replace(",", "")) if m else None
 
 
-def parse_new_loan(text):
-    idx = text.find("4.1.")
+def parse_new_loan(text, offsets):
+    idx = offsets["4.1."]
     if idx == -1:
         return None
-    m = re.search(r"§\s*4\.5\.\s+New Loan[^\d]+([\d,]+\.\d{2})", text[idx:idx+600])
+    m = LOAN_RE.search(text, idx, idx + 600)
     if m:
         v = float(m.group(1).replace(",", ""))
         return v if v > 0 else 0
@@ -327,20 +430,20 @@ def parse_loan_type(text, loan_amount):
     Cash if section 4.5 is omitted or loan amount is 0.
     Otherwise look for FHA/VA checkboxes, default Conventional.
     """
-    if re.search(r"4\.5\. New Loan\. \(Omitted", text):
+    if CASH_OMITTED_RE.search(text):
         return "Cash"
     if not loan_amount or loan_amount == 0:
         return "Cash"
     # Has a loan - detect type
-    if re.search(r"FHA [Ii]nsured", text):
+    if FHA_RE.search(text):
         return "FHA"
-    if re.search(r"VA [Gg]uaranteed", text):
+    if VA_RE.search(text):
         return "VA"
     return "Conventional"
 
 
 def parse_concession(text):
-    m = re.search(r"credit to Buyer .([^\(]+)\(Seller Concession\)", text)
+    m = CONCESSION_RE.search(text)
     if not m:
         return 0
     raw = m.group(1).strip().replace(",", "").replace("$", "")
@@ -353,7 +456,7 @@ def parse_concession(text):
 
 
 def parse_commission(text):
-    m = re.search(r"29\.1\.\s+([\d\.]+)%\s+of the Purchase Price", text)
+    m = COMMISSION_RE.search(text)
     if m:
         try:
             return float(m.group(1)) / 100
@@ -362,40 +465,33 @@ def parse_commission(text):
     return None
 
 
-def parse_title_insurance(pdf_obj, render_cache):
+def parse_title_insurance(pages, render_cache):
     """
     8.1.1 checked = Seller Pays (Seller selects / pays)
     8.1.2 checked = Buyer Pays (Buyer selects / pays)
     """
-    for page in pdf_obj.pages:
-        pt = page.extract_text() or ''
-        if '8.1.1' not in pt:
+    for info in pages:
+        if '8.1.1' not in info['text']:
             continue
-        chars = page.chars
-        anchor_y = find_section_anchor_y('8.1.1', chars)
+        page = info['page']
+        anchor_y = find_section_anchor_y('8.1.1', info['anchors'])
         if anchor_y is None:
             continue
 
-        pid = id(page)
-        if pid not in render_cache:
-            img_render = page.to_image(resolution=150)
-            pil = img_render.original
-            render_cache[pid] = (pil, pil.width / page.width, pil.height / page.height)
-        pil_img, scale_x, scale_y = render_cache[pid]
-
-        checkboxes = get_page_checkboxes(page)
-        cbs = [cb for cb in checkboxes
+        cbs = [cb for cb in info['checkboxes']
                if anchor_y - 100 <= cb['y0'] <= anchor_y + 5]
 
         if not cbs:
             continue
 
-        best_cb = min(cbs, key=lambda cb: checkbox_brightness(page, cb, pil_img, scale_x, scale_y))
-        best_br = checkbox_brightness(page, best_cb, pil_img, scale_x, scale_y)
-        if best_br > 150:
+        gray, scale_x, scale_y = render_page(page, render_cache)
+
+        best_cb = min(cbs, key=lambda cb: checkbox_brightness(page, cb, gray, scale_x, scale_y))
+        best_br = checkbox_brightness(page, best_cb, gray, scale_x, scale_y)
+        if best_br > CHECKED_MAX_BRIGHTNESS:
             return "n/a"
 
-        raw = label_after_checkbox(best_cb, chars)
+        raw = label_after_checkbox(best_cb, info['char_bands'])
         if '8.1.1' in raw or 'Seller' in raw[:12]:
             return "Seller Pays"
         elif '8.1.2' in raw or 'Buyer' in raw[:12]:
@@ -404,42 +500,35 @@ def parse_title_insurance(pdf_obj, render_cache):
     return "n/a"
 
 
-def parse_oec(pdf_obj, render_cache):
+def parse_oec(pages, render_cache):
     """
     8.1.3 OEC: 'Will' checked = OEC included (Buyer Pays is standard)
                'Will Not' checked = n/a
     """
-    for page in pdf_obj.pages:
-        pt = page.extract_text() or ''
-        if '8.1.3' not in pt:
+    for info in pages:
+        if '8.1.3' not in info['text']:
             continue
-        chars = page.chars
-        anchor_y = find_section_anchor_y('8.1.3', chars)
+        page = info['page']
+        anchor_y = find_section_anchor_y('8.1.3', info['anchors'])
         if anchor_y is None:
             continue
 
-        pid = id(page)
-        if pid not in render_cache:
-            img_render = page.to_image(resolution=150)
-            pil = img_render.original
-            render_cache[pid] = (pil, pil.width / page.width, pil.height / page.height)
-        pil_img, scale_x, scale_y = render_cache[pid]
-
-        checkboxes = get_page_checkboxes(page)
-        cbs = [cb for cb in checkboxes
+        cbs = [cb for cb in info['checkboxes']
                if anchor_y - 30 <= cb['y0'] <= anchor_y + 5]
 
         if not cbs:
             continue
 
-        best_cb = min(cbs, key=lambda cb: checkbox_brightness(page, cb, pil_img, scale_x, scale_y))
-        best_br = checkbox_brightness(page, best_cb, pil_img, scale_x, scale_y)
-        if best_br > 150:
+        gray, scale_x, scale_y = render_page(page, render_cache)
+
+        best_cb = min(cbs, key=lambda cb: checkbox_brightness(page, cb, gray, scale_x, scale_y))
+        best_br = checkbox_brightness(page, best_cb, gray, scale_x, scale_y)
+        if best_br > CHECKED_MAX_BRIGHTNESS:
             return "n/a"
 
         same_y_cbs = [cb for cb in cbs if abs(cb['y0'] - best_cb['y0']) < 3]
         next_x = min((cb['x0'] for cb in same_y_cbs if cb['x0'] > best_cb['x1']), default=9999)
-        raw = label_after_checkbox(best_cb, chars, next_x)
+        raw = label_after_checkbox(best_cb, info['char_bands'], next_x)
         if raw.strip().upper().startswith('WILL NOT'):
             return "n/a"
         elif raw.strip().upper().startswith('WILL'):
@@ -449,33 +538,22 @@ def parse_oec(pdf_obj, render_cache):
 
 
 
-def parse_assoc_assessments(pdf_obj, render_cache={}):
+def parse_assoc_assessments(pages, render_cache):
     """
     Section 16.2: special assessment obligation is [Buyer] or [Seller] only.
     (No One-Half/N/A option — this is a 2-checkbox section with unique layout.)
     """
-    for page in pdf_obj.pages:
-        pt = page.extract_text() or ''
+    for info in pages:
+        pt = info['text']
         if '16.2.' not in pt or 'Association Assessments' not in pt:
             continue
 
-        chars = page.chars
-        checkboxes = get_page_checkboxes(page)
+        page       = info['page']
+        chars      = info['chars']
+        checkboxes = info['checkboxes']
 
         # Find 16.2 section header (not a cross-reference)
-        anchor_y = None
-        for i, c in enumerate(chars):
-            if c['text'] not in '0123456789' or c['x0'] > 150:
-                continue
-            frag = ''.join(ch['text'] for ch in chars[i:i+10]).replace(' ', '').replace('.', '')
-            if not frag.startswith('162'):
-                continue
-            prev = ''.join(ch['text'] for ch in chars[max(0, i-4):i])
-            if '§' in prev:
-                continue
-            anchor_y = c['y0']
-            break
-
+        anchor_y = find_section_anchor_y('16.2.', info['anchors'])
         if anchor_y is None:
             continue
 
@@ -494,32 +572,13 @@ def parse_assoc_assessments(pdf_obj, render_cache={}):
         if not section_cbs:
             return 'n/a'
 
-        pid = id(page)
-        if pid not in render_cache:
-            img_render = page.to_image(resolution=150)
-            pil = img_render.original
-            render_cache[pid] = (pil, pil.width / page.width, pil.height / page.height)
-        pil_img, sx, sy = render_cache[pid]
-
-        def cb_br(cb):
-            ix = int(cb['x0'] * sx)
-            iy = int((page.height - cb['y1']) * sy)
-            iw = max(1, int((cb['x1'] - cb['x0']) * sx))
-            ih = max(1, int((cb['y1'] - cb['y0']) * sy))
-            crop = pil_img.crop((ix, iy, ix + iw, iy + ih))
-            gray = crop.convert('L')
-            pixels = list(gray.getdata())
-            return sum(pixels) / len(pixels) if pixels else 255
-
-        best = min(section_cbs, key=cb_br)
-        if cb_br(best) > 150:
+        gray, sx, sy = render_page(page, render_cache)
+
+        best = min(section_cbs, key=lambda cb: checkbox_brightness(page, cb, gray, sx, sy))
+        if checkbox_brightness(page, best, gray, sx, sy) > CHECKED_MAX_BRIGHTNESS:
             return 'n/a'
 
-        cb_y_mid = (best['y0'] + best['y1']) / 2
-        lc = [c for c in chars
-              if c['x0'] >= best['x1'] - 1 and c['x0'] < best['x1'] + 80
-              and abs((c['y0'] + c['y1']) / 2 - cb_y_mid) < 4]
-        label = ''.join(c['text'] for c in sorted(lc, key=lambda c: c['x0']))[:15].strip().upper()
+        label = label_after_checkbox(best, info['char_bands'], best['x1'] + 80).upper()
 
         if 'BUYER' in label[:6]:
             return 'Buyer Pays'
@@ -528,34 +587,22 @@ def parse_assoc_assessments(pdf_obj, render_cache={}):
         return 'n/a'
     return 'n/a'
 
-def parse_deadline_line(line):
-    """Parse one row from the §3.1 deadline table."""
-    m = re.match(r"^(\d+)\s+(?:§\s*[\w\.]+|n/a)\s+", line)
-    if not m:
-        return None, None
-    item = int(m.group(1))
-    if item > 43:
-        return None, None
-
-    rest = line[m.end():]
-    split_points = [km.end() for kw in ("Deadline", "Date", "Time")
-                    for km in re.finditer(r"\b" + kw + r"\b", rest)]
+def parse_deadline_value(rest):
+    """Extract the date/deadline from the text after a §3.1 row's reference."""
+    split_points = [km.end() for km in DEADLINE_KW_RE.finditer(rest)]
 
     if split_points:
         value = rest[max(split_points):].strip()
-        value = re.sub(r"^\([^)]+\)\s*", "", value).strip()
+        value = PAREN_LEAD_RE.sub("", value).strip()
     else:
         value = rest.strip()
 
-    value = re.sub(
-        r"\s+(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)$",
-        "", value, flags=re.IGNORECASE
-    ).strip()
+    value = WEEKDAY_TAIL_RE.sub("", value).strip()
 
     if not value or value.upper() == "N/A":
         value = "n/a"
 
-    return item, value
+    return value
 
 
 def parse_deadlines(text):
@@ -563,46 +610,42 @@ def parse_deadlines(text):
     if start == -1:
         return {}
     end = text.find("4. PURCHASE PRICE AND TERMS", start)
-    table = text[start:end] if end != -1 else text[start:start+3000]
+    if end == -1:
+        end = start + 3000
 
+    # One regex pass over the table finds every "<item> <§ ref|n/a> ..." row
     results = {}
-    for line in table.split("\n"):
-        item, value = parse_deadline_line(line.strip())
-        if item is not None:
-            results[item] = value
+    for m in DEADLINE_ROW_RE.finditer(text, start, end):
+        item = int(m.group(1))
+        if item <= 43:
+            results[item] = parse_deadline_value(m.group(2))
     return results
 
 
-def parse_inclusions(text):
-    idx = text.find("2.5.3.")
+def parse_inclusions(text, offsets):
+    idx = offsets["2.5.3."]
     if idx == -1:
         return ""
-    m = re.search(
-        r"included in the Purchase Price:\s*\n(.+?)(?:\n\n|If the box|2\.5\.4)",
-        text[idx:idx+500], re.DOTALL
-    )
+    m = INCLUSIONS_RE.search(text, idx, idx + 500)
     return " ".join(m.group(1).split()) if m else ""
 
 
-def parse_exclusions(text):
-    idx = text.find("2.6.")
+def parse_exclusions(text, offsets):
+    idx = offsets["2.6."]
     if idx == -1:
         return "n/a"
-    m = re.search(r"Exclusions\):\s*\n?(.+?)(?:\n\n|2\.7\.)", text[idx:idx+300], re.DOTALL)
+    m = EXCLUSIONS_RE.search(text, idx, idx + 300)
     if m:
         val = " ".join(m.group(1).split())
         return val if val.upper() not in ("N/A", "") else "n/a"
     return "n/a"
 
 
-def parse_additional_provisions(text):
-    idx = text.find("30.")
+def parse_additional_provisions(text, offsets):
+    idx = offsets["30."]
     if idx == -1:
         return "n/a"
-    m = re.search(
-        r"Colorado Real Estate Commission:\s*\n(.+?)(?=\n31\.)",
-        text[idx:idx+2000], re.DOTALL
-    )
+    m = ADD_PROV_RE.search(text, idx, idx + 2000)
     if not m:
         return "n/a"
     raw = m.group(1).strip()
@@ -618,38 +661,44 @@ def parse_additional_provisions(text):
 
 def parse_contract(pdf_path):
     """Parse a CBS1 PDF. Returns {row_number: value} for all auto-fillable fields."""
-    text = pdf_text(pdf_path)
-    deadlines = parse_deadlines(text)
-
-    render_cache = {}  # shared across all checkbox calls for this PDF
+    render_cache = {}  # page renders for this PDF only; cleared below
 
+    # Open once: every pdfplumber.open() reparses the whole file
     with pdfplumber.open(pdf_path) as pdf_obj:
-        loan_amount = parse_new_loan(text)
+        pages     = index_pages(pdf_obj)
+        text      = pdf_text(pages)
+        offsets   = section_offsets(text)
+        deadlines = parse_deadlines(text)
+
+        loan_amount = parse_new_loan(text, offsets)
         loan_type   = parse_loan_type(text, loan_amount)
         is_cash     = (loan_type == "Cash")
 
-        title_ins  = parse_title_insurance(pdf_obj, render_cache)
-        oec        = parse_oec(pdf_obj, render_cache)
+        title_ins  = parse_title_insurance(pages, render_cache)
+        oec        = parse_oec(pages, render_cache)
 
         fee_sections = {
-            ROW_CLOSING_SVC:  get_fee_value(pdf_obj, '15.2.', render_cache=render_cache),
-            ROW_RECORD_CHG:   get_fee_value(pdf_obj, '15.3.2.', render_cache=render_cache),
-            ROW_RESERVES:     get_fee_value(pdf_obj, '15.3.3.', render_cache=render_cache),
-            ROW_OTHER_FEES:   get_fee_value(pdf_obj, '15.3.4.', render_cache=render_cache),
-            ROW_LOCAL_TAX:    get_fee_value(pdf_obj, '15.4.', render_cache=render_cache),
-            ROW_SALES_TAX:    get_fee_value(pdf_obj, '15.5.', render_cache=render_cache),
-            ROW_PRIVATE_XFER: get_fee_value(pdf_obj, '15.6.', render_cache=render_cache),
-            ROW_WATER_XFER:   get_fee_value(pdf_obj, '15.7.', render_cache=render_cache),
-            ROW_UTILITY_XFER: get_fee_value(pdf_obj, '15.8.', render_cache=render_cache),
-            ROW_ASSOC_ASSESS: parse_assoc_assessments(pdf_obj, render_cache),
+            ROW_CLOSING_SVC:  get_fee_value(pages, '15.2.', render_cache=render_cache),
+            ROW_RECORD_CHG:   get_fee_value(pages, '15.3.2.', render_cache=render_cache),
+            ROW_RESERVES:     get_fee_value(pages, '15.3.3.', render_cache=render_cache),
+            ROW_OTHER_FEES:   get_fee_value(pages, '15.3.4.', render_cache=render_cache),
+            ROW_LOCAL_TAX:    get_fee_value(pages, '15.4.', render_cache=render_cache),
+            ROW_SALES_TAX:    get_fee_value(pages, '15.5.', render_cache=render_cache),
+            ROW_PRIVATE_XFER: get_fee_value(pages, '15.6.', render_cache=render_cache),
+            ROW_WATER_XFER:   get_fee_value(pages, '15.7.', render_cache=render_cache),
+            ROW_UTILITY_XFER: get_fee_value(pages, '15.8.', render_cache=render_cache),
+            ROW_ASSOC_ASSESS: parse_assoc_assessments(pages, render_cache),
         }
 
+    # Free the rendered pages now rather than holding them for the whole run
+    render_cache.clear()
+
     data = {
         ROW_BUYER:         parse_buyer(text),
-        ROW_AGENT:         parse_agent(pdf_path),
-        ROW_PRICE:         parse_price(text),
+        ROW_AGENT:         parse_agent(pages[0]['text']),
+        ROW_PRICE:         parse_price(text, offsets),
         ROW_CONCESSION:    parse_concession(text),
-        ROW_EARNEST:       parse_earnest(text),
+        ROW_EARNEST:       parse_earnest(text, offsets),
         ROW_LOAN_AMOUNT:   loan_amount,
         ROW_LOAN_TYPE:     loan_type,
         ROW_LENDER:        "n/a" if is_cash else None,
@@ -657,9 +706,9 @@ def parse_contract(pdf_path):
         ROW_TITLE_INS:     title_ins,
         ROW_OEC:           oec,
         ROW_NET_ESCAL:     "n/a",
-        ROW_INCLUSIONS:    parse_inclusions(text),
-        ROW_EXCLUSIONS:    parse_exclusions(text),
-        ROW_ADD_PROV:      parse_additional_provisions(text),
+        ROW_INCLUSIONS:    parse_inclusions(text, offsets),
+        ROW_EXCLUSIONS:    parse_exclusions(text, offsets),
+        ROW_ADD_PROV:      parse_additional_provisions(text, offsets),
     }
 
     # Merge fee sections
@@ -675,6 +724,44 @@ def parse_contract(pdf_path):
     return data
 
 
+def cached_parse_contract(pdf_path):
+    """
+    parse_contract() with a disk cache keyed by the MD5 of the PDF bytes
+    plus the settings that affect checkbox detection.
+    The cache is best-effort: any read/write failure just means a re-parse.
+    """
+    digest = hashlib.md5(Path(pdf_path).read_bytes()).hexdigest()
+    cache_file = CACHE_DIR / (f"v{CACHE_VERSION}_dpi{RENDER_DPI}"
+                              f"_b{CHECKED_MAX_BRIGHTNESS}_{digest}.pkl")
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # Corrupt or unreadable entry: drop it so the next run doesn't trip on it
+        try:
+            cache_file.unlink()
+        except OSError:
+            pass
+
+    data = parse_contract(pdf_path)
+
+    # Write to a temp file first so parallel workers never read a partial pickle
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        with open(tmp_file, "wb") as f:
+            pickle.dump(data, f)
+        os.replace(tmp_file, cache_file)
+    except Exception:
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+    return data
+
+
 # ── Excel writing ─────────────────────────────────────────────────────────────
 
 def find_next_col(ws, start_col=3):
@@ -684,27 +771,37 @@ def find_next_col(ws, start_col=3):
     return col
 
 
-def copy_formatting(ws, src_col, dst_col, last_row=103):
+def template_column(ws, src_col, last_row=103):
+    """
+    Snapshot the reference column once per run.
+    Returns [(row, style, formula)] for every cell with a style or formula
+    (either may be None); the column itself is never written to.
+    """
+    cells = []
+    for row in range(1, last_row + 1):
+        src = ws.cell(row=row, column=src_col)
+        style = src._style if src.has_style else None
+        formula = src.value if isinstance(src.value, str) and src.value.startswith("=") else None
+        if style is not None or formula is not None:
+            cells.append((row, style, formula))
+    return cells
+
+
+def copy_formatting(ws, template_cells, src_col, dst_col):
     src_ltr = get_column_letter(src_col)
     dst_ltr = get_column_letter(dst_col)
+    col_ref = re.compile(r"(?<!\$)" + re.escape(src_ltr) + r"(?=\$?\d)")
 
-    for row in range(1, last_row + 1):
-        src = ws.cell(row=row, column=src_col)
+    for row, style, formula in template_cells:
         dst = ws.cell(row=row, column=dst_col)
 
-        if src.has_style:
-            dst.font          = copy.copy(src.font)
-            dst.fill          = copy.copy(src.fill)
-            dst.border        = copy.copy(src.border)
-            dst.alignment     = copy.copy(src.alignment)
-            dst.number_format = src.number_format
-
-        if isinstance(src.value, str) and src.value.startswith("="):
-            dst.value = re.sub(
-                r"(?<!\$)" + re.escape(src_ltr) + r"(?=\$?\d)",
-                dst_ltr,
-                src.value
-            )
+        # _style holds the cell's font/fill/border/alignment/number format
+        # as indices into the workbook's shared style tables
+        if style is not None:
+            dst._style = copy.copy(style)
+
+        if formula is not None:
+            dst.value = col_ref.sub(dst_ltr, formula)
 
     ws.column_dimensions[dst_ltr].width = ws.column_dimensions[src_ltr].width
 
@@ -781,22 +878,27 @@ def main():
     print("\nLoading template...")
     wb = load_workbook(template)
     ws = wb.active
+    template_cells = template_column(ws, src_col=2)
 
+    # PDFs are parsed in parallel worker processes; the workbook is only
+    # touched here in the main process, in the original file order.
     errors = []
-    for i, pdf_path in enumerate(pdfs, 1):
-        print(f"[{i}/{len(pdfs)}] {pdf_path.name} ... ", end="", flush=True)
-        try:
-            data    = parse_contract(str(pdf_path))
-            dst_col = find_next_col(ws)
-            copy_formatting(ws, src_col=2, dst_col=dst_col)
-            write_offer(ws, dst_col, dst_col - 2, data)
-            buyer     = data.get(ROW_BUYER) or "?"
-            price     = data.get(ROW_PRICE)
-            price_str = f"${price:,.0f}" if price else "?"
-            print(f"OK  —  {buyer}  /  {price_str}")
-        except Exception as e:
-            print(f"ERROR: {e}")
-            errors.append((pdf_path.name, str(e)))
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(cached_parse_contract, str(pdf_path)) for pdf_path in pdfs]
+        for i, (pdf_path, future) in enumerate(zip(pdfs, futures), 1):
+            print(f"[{i}/{len(pdfs)}] {pdf_path.name} ... ", end="", flush=True)
+            try:
+                data    = future.result()
+                dst_col = find_next_col(ws)
+                copy_formatting(ws, template_cells, src_col=2, dst_col=dst_col)
+                write_offer(ws, dst_col, dst_col - 2, data)
+                buyer     = data.get(ROW_BUYER) or "?"
+                price     = data.get(ROW_PRICE)
+                price_str = f"${price:,.0f}" if price else "?"
+                print(f"OK  —  {buyer}  /  {price_str}")
+            except Exception as e:
+                print(f"ERROR: {e}")
+                errors.append((pdf_path.name, str(e)))
 
     wb.save(output)
     print()